@@ -6,48 +6,155 @@ Inputs:
   data/silver/decision_events_clean.jsonl
   data/rejects/decision_events_rejects.jsonl
 
-Outputs:
-  data/gold/fact_ai_decisions_daily.csv
-  data/gold/fact_ai_decisions_daily.jsonl
-  data/gold/fact_ai_rejects_daily.csv
-  data/gold/fact_ai_rejects_daily.jsonl
+Outputs (--formats, default csv,jsonl; parquet needs pyarrow):
+  data/gold/fact_ai_decisions_daily.{csv,jsonl,parquet}
+  data/gold/fact_ai_rejects_daily.{csv,jsonl,parquet}
 
 Aggregations:
 - Decisions: by day, risk_band, model_version
 - Rejects: by day, reject_reason_code
+
+Group-bys run in Polars when it is installed, else in plain Python.
 """
 
 from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import json
+import math
+import os
+import re
 from collections import defaultdict
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
+try:
+    import orjson
 
-def _read_jsonl(path: Path) -> Iterable[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    with path.open("r", encoding="utf-8") as f:
+    def _json_loads(line: bytes) -> Any:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:  # e.g. NaN/Infinity, which json.loads accepts
+            return json.loads(line)
+
+    def _json_dumps(obj: Any) -> bytes:
+        # orjson writes NaN/Infinity as null; Gold rows are few, so check and keep json's tokens.
+        if any(isinstance(v, float) and not math.isfinite(v) for v in obj.values()):
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return orjson.dumps(obj)
+
+except ImportError:  # stdlib fallback keeps the script dependency-free
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Input file buffer size; larger reads make the C line iterator noticeably faster.
+_READ_BUFFER = 1 << 20
+# Output file buffer size and flush threshold for accumulated JSONL bytes.
+_WRITE_BUFFER = 1 << 20
+# Below this size the pure-Python aggregation runs serially; process start-up isn't worth it.
+_SHARD_MIN_BYTES = 50 * 1024 * 1024
+# Confidence sums are kept exactly so the Gold average can't depend on summation order
+# (Polars threads, row loop or shards): in 1/_DECIMAL_SCALE units while every score of
+# a key is an exact 4-decimal value (as Silver writes them), else in 2**-_FIXED_SHIFT units.
+_DECIMAL_SCALE = 10_000
+_FIXED_SHIFT = 1074
+
+T = TypeVar("T")
+
+try:
+    import polars as pl
+except ImportError:  # falls back to the pure-Python aggregation below
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # only needed for --formats parquet
+    pa = None
+
+OUTPUT_FORMATS = ("csv", "jsonl", "parquet")
+DECISIONS_FIELDS = ["decision_day", "risk_band", "model_version", "decisions_count", "avg_confidence_score"]
+REJECTS_FIELDS = ["reject_day", "reject_reason_code", "rejects_count"]
+
+
+def _iter_jsonl_bytes(path: Path, start: int = 0, end: Optional[int] = None) -> Iterable[bytes]:
+    """
+    Yields the stripped, non-empty lines of a JSONL file as bytes.
+    With start/end, only lines beginning inside [start, end) are read.
+    """
+    with path.open("rb", buffering=_READ_BUFFER) as f:
+        f.seek(start)
+        pos = start
         for line in f:
+            if end is not None and pos >= end:
+                break
+            pos += len(line)
             line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-                if isinstance(obj, dict):
-                    yield obj
-            except Exception:
-                continue
+            if line:
+                yield line
 
 
-def _day_bucket(iso_ts: Any) -> str:
-    if not isinstance(iso_ts, str) or not iso_ts.strip():
+def _read_jsonl(path: Path, start: int = 0, end: Optional[int] = None) -> Iterable[Dict[str, Any]]:
+    if not path.exists():
+        return []
+    for line in _iter_jsonl_bytes(path, start, end):
+        try:
+            obj = _json_loads(line)
+            if isinstance(obj, dict):
+                yield obj
+        except Exception:
+            continue
+
+
+def _line_aligned_ranges(path: Path, n: int) -> List[Tuple[int, int]]:
+    """Splits a file into up to n byte ranges, each starting at the beginning of a line."""
+    size = path.stat().st_size
+    bounds = [0]
+    with path.open("rb") as f:
+        for i in range(1, n):
+            f.seek(max(size * i // n - 1, bounds[-1]))
+            f.readline()  # finish the line straddling the cut
+            pos = f.tell()
+            if pos >= size:
+                break
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _map_shards(fn: Callable[[Path, int, Optional[int]], T], path: Path, workers: int) -> List[T]:
+    """
+    Runs fn(path, start, end) over line-aligned byte ranges in worker processes,
+    or once over the whole file when it is small or workers <= 1.
+    """
+    if workers <= 1 or path.stat().st_size < _SHARD_MIN_BYTES:
+        return [fn(path, 0, None)]
+    ranges = _line_aligned_ranges(path, workers)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as ex:
+        return list(ex.map(fn, [path] * len(ranges), [a for a, _ in ranges], [b for _, b in ranges]))
+
+
+# Normalized Silver/Rejects timestamp: YYYY-MM-DDTHH:MM:SS[.ffffff]Z
+_ISO_Z_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T(?:[01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](?:\.[0-9]{6})?Z")
+
+
+@functools.lru_cache(maxsize=4096)
+def _date_part(ymd: str) -> str:
+    try:
+        return date.fromisoformat(ymd).isoformat()
+    except Exception:
         return "UNKNOWN_DAY"
-    s = iso_ts.strip()
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _parse_day(s: str) -> str:
     try:
         if s.endswith("Z"):
             dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
@@ -58,20 +165,246 @@ def _day_bucket(iso_ts: Any) -> str:
         return "UNKNOWN_DAY"
 
 
+def _day_bucket(iso_ts: Any) -> str:
+    if not isinstance(iso_ts, str) or not iso_ts.strip():
+        return "UNKNOWN_DAY"
+    s = iso_ts.strip()
+    # Fast path: for a normalized timestamp only the (low-cardinality) date prefix
+    # can still fail to parse, so check just that.
+    if _ISO_Z_RE.fullmatch(s):
+        return _date_part(s[:10])
+    return _parse_day(s)
+
+
 def _write_csv(path: Path, rows: List[Dict[str, Any]], fieldnames: List[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow({k: r.get(k) for k in fieldnames})
+    with path.open("w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        w.writerows([r.get(k) for k in fieldnames] for r in rows)
 
 
 def _write_jsonl(path: Path, rows: List[Dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
+    buf = bytearray()
+    with path.open("wb", buffering=_WRITE_BUFFER) as f:
         for r in rows:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+            buf += _json_dumps(r)
+            buf += b"\n"
+            if len(buf) >= _WRITE_BUFFER:
+                f.write(buf)
+                buf.clear()
+        f.write(buf)
+
+
+def _write_parquet(path: Path, rows: List[Dict[str, Any]], fieldnames: List[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Explicit types so empty or all-null columns keep their Gold schema.
+    types = {"decisions_count": pa.int64(), "rejects_count": pa.int64(), "avg_confidence_score": pa.float64()}
+    schema = pa.schema([(k, types.get(k, pa.string())) for k in fieldnames])
+    table = pa.Table.from_pylist(rows, schema=schema)
+    pq.write_table(table, path, compression="zstd", use_dictionary=True)
+
+
+def _pl_day_key(col: str) -> Tuple["pl.Expr", "pl.Expr"]:
+    """
+    Returns (is_normalized, key) expressions to group by in place of the day:
+    the date prefix of a normalized "...Z" timestamp, else the raw value.
+    _day_from_key turns a group back into the same day _day_bucket gives.
+    """
+    is_normalized = pl.col(col).str.contains(f"^{_ISO_Z_RE.pattern}$").fill_null(False)
+    key = pl.when(is_normalized).then(pl.col(col).str.slice(0, 10)).otherwise(pl.col(col))
+    return is_normalized.alias("is_normalized"), key.alias("day_key")
+
+
+def _day_from_key(is_normalized: bool, key: Optional[str]) -> str:
+    return _date_part(key) if is_normalized else _day_bucket(key)
+
+
+def _pl_or_unknown(col: str) -> "pl.Expr":
+    c = pl.col(col)
+    return pl.when(c.is_null() | (c == "")).then(pl.lit("UNKNOWN")).otherwise(c.str.strip_chars())
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _to_fixed(x: float) -> int:
+    """x as an integer number of 2**-1074 units (exact: every finite float is a whole multiple)."""
+    n, d = x.as_integer_ratio()
+    return n << (_FIXED_SHIFT + 1 - d.bit_length())
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _to_decimal(x: float) -> Optional[int]:
+    """x in 1/_DECIMAL_SCALE units if it is exactly such a value (as a float), else None."""
+    k = round(x * _DECIMAL_SCALE)
+    return k if k / _DECIMAL_SCALE == x else None
+
+
+def _score_acc(totals: Dict[Any, List[Any]], key: Any) -> List[Any]:
+    # [count, fixed-point sum, sum of any inf/nan scores, decimal sum (None once a score isn't 4-decimal)]
+    acc = totals.get(key)
+    if acc is None:
+        acc = totals[key] = [0, 0, 0.0, 0]
+    return acc
+
+
+def _add_score(acc: List[Any], x: float, n: int = 1) -> None:
+    if math.isfinite(x):
+        acc[1] += _to_fixed(x) * n
+        if acc[3] is not None:
+            k = _to_decimal(x)
+            acc[3] = None if k is None else acc[3] + k * n
+    else:
+        acc[2] += x * n
+        acc[3] = None
+
+
+def _merge_acc(acc: List[Any], other: List[Any]) -> None:
+    acc[0] += other[0]
+    acc[1] += other[1]
+    acc[2] += other[2]
+    acc[3] = None if acc[3] is None or other[3] is None else acc[3] + other[3]
+
+
+def _score_sum(acc: List[Any]) -> float:
+    # Integer true division rounds correctly, so this is the exact sum rounded once.
+    if acc[3] is not None:
+        return acc[3] / _DECIMAL_SCALE
+    return acc[1] / (1 << _FIXED_SHIFT) + acc[2]
+
+
+def _decision_totals(path: Path, start: int = 0, end: Optional[int] = None) -> Dict[Tuple[str, str, str], List[Any]]:
+    # One _score_acc accumulator per key: a single hash lookup per row. Accumulators
+    # stay exact so shard results can be merged without changing the rounded sum.
+    totals: Dict[Tuple[str, str, str], List[Any]] = {}
+
+    for row in _read_jsonl(path, start, end):
+        day = _day_bucket(row.get("decision_ts"))
+        risk_band = (row.get("risk_band") or "UNKNOWN").strip()
+        model_version = (row.get("model_version") or "UNKNOWN").strip()
+        acc = _score_acc(totals, (day, risk_band, model_version))
+        acc[0] += 1
+        try:
+            score = float(row.get("confidence_score"))
+        except Exception:
+            continue
+        _add_score(acc, score)
+
+    return totals
+
+
+def _reject_totals(path: Path, start: int = 0, end: Optional[int] = None) -> Dict[Tuple[str, str], int]:
+    counts: Dict[Tuple[str, str], int] = defaultdict(int)
+    for row in _read_jsonl(path, start, end):
+        day = _day_bucket(row.get("rejected_at_utc"))
+        reason = (row.get("reject_reason_code") or "UNKNOWN").strip().upper()
+        key = (day, reason)
+        counts[key] += 1
+
+    return counts
+
+
+def _aggregate_decisions(
+    path: Path, workers: int = 1
+) -> Tuple[Dict[Tuple[str, str, str], int], Dict[Tuple[str, str, str], float]]:
+    """
+    Returns ((day, risk_band, model_version) -> count, same key -> confidence sum).
+    Uses a Polars group_by when available, else a row-at-a-time loop
+    (sharded across `workers` processes for large files).
+    """
+    totals: Dict[Tuple[str, str, str], List[Any]] = {}
+    if not path.exists():
+        return {}, {}
+
+    if pl is not None:
+        try:
+            events = pl.scan_ndjson(
+                path,
+                schema={
+                    "decision_ts": pl.String,
+                    "risk_band": pl.String,
+                    "model_version": pl.String,
+                    "confidence_score": pl.Float64,
+                },
+            ).cache()  # scanned once for both queries below
+            keys = (
+                *_pl_day_key("decision_ts"),
+                _pl_or_unknown("risk_band").alias("risk_band"),
+                _pl_or_unknown("model_version").alias("model_version"),
+            )
+            # Exact Int64 sum in 1/_DECIMAL_SCALE units. It is only used when every distinct
+            # score passes _to_decimal (checked in Python: Polars divides by a constant via its
+            # reciprocal, which isn't exact) and is within [-1, 1], so the sum can't overflow.
+            units = (pl.col("confidence_score") * _DECIMAL_SCALE).round().cast(pl.Int64, strict=False)
+            agg, scores = pl.collect_all(
+                [
+                    events.group_by(*keys).agg(pl.len().alias("cnt"), units.sum().alias("units")),
+                    events.select(pl.col("confidence_score").unique()),
+                ]
+            )
+            by_score = not all(
+                x is None or (abs(x) <= 1.0 and _to_decimal(x) is not None)
+                for x in scores["confidence_score"]
+            )
+            if by_score:
+                # Some scores aren't 4-decimal: count rows per distinct score and fold those in Python.
+                agg = events.group_by(*keys, "confidence_score").agg(pl.len().alias("cnt")).collect()
+        except Exception:
+            pass  # e.g. unexpected column types; use the tolerant loop instead
+        else:
+            if by_score:
+                for is_normalized, day_key, risk_band, model_version, score_value, cnt in agg.iter_rows():
+                    acc = _score_acc(totals, (_day_from_key(is_normalized, day_key), risk_band, model_version))
+                    acc[0] += cnt
+                    if score_value is not None:
+                        _add_score(acc, score_value, cnt)
+            else:
+                for is_normalized, day_key, risk_band, model_version, cnt, unit_sum in agg.iter_rows():
+                    acc = _score_acc(totals, (_day_from_key(is_normalized, day_key), risk_band, model_version))
+                    acc[0] += cnt
+                    acc[3] += unit_sum
+            return {k: acc[0] for k, acc in totals.items()}, {k: _score_sum(acc) for k, acc in totals.items()}
+
+    for part in _map_shards(_decision_totals, path, workers):
+        for key, part_acc in part.items():
+            _merge_acc(_score_acc(totals, key), part_acc)
+
+    return {k: acc[0] for k, acc in totals.items()}, {k: _score_sum(acc) for k, acc in totals.items()}
+
+
+def _aggregate_rejects(path: Path, workers: int = 1) -> Dict[Tuple[str, str], int]:
+    """
+    Returns (day, reject_reason_code) -> count.
+    Uses a Polars group_by when available, else a row-at-a-time loop
+    (sharded across `workers` processes for large files).
+    """
+    counts: Dict[Tuple[str, str], int] = defaultdict(int)
+    if not path.exists():
+        return counts
+
+    if pl is not None:
+        try:
+            agg = (
+                pl.scan_ndjson(path, schema={"rejected_at_utc": pl.String, "reject_reason_code": pl.String})
+                .group_by(
+                    *_pl_day_key("rejected_at_utc"),
+                    _pl_or_unknown("reject_reason_code").str.to_uppercase().alias("reason"),
+                )
+                .agg(pl.len().alias("cnt"))
+                .collect()
+            )
+        except Exception:
+            pass  # e.g. unexpected column types; use the tolerant loop instead
+        else:
+            for is_normalized, day_key, reason, cnt in agg.iter_rows():
+                counts[(_day_from_key(is_normalized, day_key), reason)] += cnt
+            return counts
+
+    for part in _map_shards(_reject_totals, path, workers):
+        for k, v in part.items():
+            counts[k] += v
+
+    return counts
 
 
 def main() -> None:
@@ -79,26 +412,23 @@ def main() -> None:
     p.add_argument("--silver", default="data/silver/decision_events_clean.jsonl", help="Silver clean JSONL.")
     p.add_argument("--rejects", default="data/rejects/decision_events_rejects.jsonl", help="Rejects JSONL.")
     p.add_argument("--outdir", default="data/gold", help="Gold output directory.")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes for large inputs without Polars.")
+    p.add_argument("--formats", default="csv,jsonl", help="Comma-separated Gold formats: csv, jsonl, parquet.")
     args = p.parse_args()
 
+    formats = [f.strip().lower() for f in args.formats.split(",") if f.strip()]
+    unknown = sorted(set(formats) - set(OUTPUT_FORMATS))
+    if not formats or unknown:
+        raise SystemExit(f"--formats must be a comma-separated subset of {','.join(OUTPUT_FORMATS)}")
+    if "parquet" in formats and pa is None:
+        raise SystemExit("--formats parquet requires pyarrow (pip install pyarrow)")
+
     silver_path = Path(args.silver)
     rejects_path = Path(args.rejects)
     outdir = Path(args.outdir)
 
     # Decisions aggregate: (day, risk_band, model_version) -> count, avg_conf
-    decisions_counts: Dict[Tuple[str, str, str], int] = defaultdict(int)
-    decisions_conf_sum: Dict[Tuple[str, str, str], float] = defaultdict(float)
-
-    for row in _read_jsonl(silver_path):
-        day = _day_bucket(row.get("decision_ts"))
-        risk_band = (row.get("risk_band") or "UNKNOWN").strip()
-        model_version = (row.get("model_version") or "UNKNOWN").strip()
-        key = (day, risk_band, model_version)
-        decisions_counts[key] += 1
-        try:
-            decisions_conf_sum[key] += float(row.get("confidence_score"))
-        except Exception:
-            pass
+    decisions_counts, decisions_conf_sum = _aggregate_decisions(silver_path, args.workers)
 
     decisions_out: List[Dict[str, Any]] = []
     for (day, risk_band, model_version), cnt in sorted(decisions_counts.items()):
@@ -114,12 +444,7 @@ def main() -> None:
         )
 
     # Rejects aggregate: (day, reject_reason_code) -> count
-    rejects_counts: Dict[Tuple[str, str], int] = defaultdict(int)
-    for row in _read_jsonl(rejects_path):
-        day = _day_bucket(row.get("rejected_at_utc"))
-        reason = (row.get("reject_reason_code") or "UNKNOWN").strip().upper()
-        key = (day, reason)
-        rejects_counts[key] += 1
+    rejects_counts = _aggregate_rejects(rejects_path, args.workers)
 
     rejects_out: List[Dict[str, Any]] = []
     for (day, reason), cnt in sorted(rejects_counts.items()):
@@ -131,23 +456,29 @@ def main() -> None:
             }
         )
 
-    # Write outputs
-    decisions_csv = outdir / "fact_ai_decisions_daily.csv"
-    decisions_jsonl = outdir / "fact_ai_decisions_daily.jsonl"
-    rejects_csv = outdir / "fact_ai_rejects_daily.csv"
-    rejects_jsonl = outdir / "fact_ai_rejects_daily.jsonl"
+    # Write outputs; files are independent, so each gets its own writer thread.
+    jobs: List[Tuple[Path, int, Callable[..., None], tuple]] = []
+    for name, rows, fields in (
+        ("fact_ai_decisions_daily", decisions_out, DECISIONS_FIELDS),
+        ("fact_ai_rejects_daily", rejects_out, REJECTS_FIELDS),
+    ):
+        if "csv" in formats:
+            jobs.append((outdir / f"{name}.csv", len(rows), _write_csv, (rows, fields)))
+        if "jsonl" in formats:
+            jobs.append((outdir / f"{name}.jsonl", len(rows), _write_jsonl, (rows,)))
+        if "parquet" in formats:
+            jobs.append((outdir / f"{name}.parquet", len(rows), _write_parquet, (rows, fields)))
 
-    _write_csv(decisions_csv, decisions_out, ["decision_day", "risk_band", "model_version", "decisions_count", "avg_confidence_score"])
-    _write_jsonl(decisions_jsonl, decisions_out)
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        futures = [ex.submit(fn, path, *fn_args) for path, _, fn, fn_args in jobs]
+        for fut in futures:
+            fut.result()  # re-raise any writer error
 
-    _write_csv(rejects_csv, rejects_out, ["reject_day", "reject_reason_code", "rejects_count"])
-    _write_jsonl(rejects_jsonl, rejects_out)
+    written = [(path, n) for path, n, _, _ in jobs]
 
     print("Gold outputs written:")
-    print(f"- {decisions_csv} (rows={len(decisions_out)})")
-    print(f"- {decisions_jsonl} (rows={len(decisions_out)})")
-    print(f"- {rejects_csv} (rows={len(rejects_out)})")
-    print(f"- {rejects_jsonl} (rows={len(rejects_out)})")
+    for path, n in written:
+        print(f"- {path} (rows={n})")
 
 
 if __name__ == "__main__":
@@ -9,6 +9,8 @@ Features:
 - Controlled percentage of bad records for rejects
 - Mix of decision types, model versions, risk bands, facilities, policies
 - Optional override flags and reasons
+- Draws events in bulk with NumPy when installed (a given --seed reproduces
+  output only within the same path, NumPy or pure Python)
 
 Usage:
   python scripts/generate_synthetic_decisions.py --n 500 --bad-rate 0.15
@@ -24,12 +26,39 @@ import string
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+except ImportError:  # stdlib fallback keeps the script dependency-free
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+try:
+    import numpy as np
+except ImportError:  # falls back to per-event random draws
+    np = None
 
 
 VALID_RISK_BANDS = ["LOW", "MEDIUM", "HIGH"]
 VALID_DECISION_TYPES = ["coverage_recommendation", "fraud_flag", "pricing_adjustment", "claim_triage"]
 VALID_OVERRIDE_REASONS = ["HUMAN_REVIEW_REQUIRED", "OUT_OF_POLICY", "MISSING_EVIDENCE", "EXCEPTION_APPROVAL"]
+MODEL_VERSIONS = ["risk-model-v1.2", "risk-model-v1.3", "risk-model-v1.4"]
+POLICY_IDS = ["POL-1001", "POL-1002", "POL-1003", "POL-1004", "POL-2001"]
+FACILITY_CODES = ["FAC-001", "FAC-023", "FAC-102", "FAC-210"]
+
+ID_ALPHABET = string.ascii_lowercase + string.digits
+HASH_ALPHABET = "abcdef" + string.digits
+SPAN_MINUTES = 60 * 24 * 10
+OVERRIDE_RATE = 0.18
+
+# Events drawn per batch; bounds memory for large --n.
+_GEN_BATCH = 100_000
+# Output file buffer size and flush threshold for accumulated JSONL bytes.
+_WRITE_BUFFER = 1 << 20
 
 
 @dataclass
@@ -40,53 +69,121 @@ class GenConfig:
     seed: Optional[int]
 
 
-def _rand_id(prefix: str, n: int = 8) -> str:
-    return f"{prefix}_" + "".join(random.choices(string.ascii_lowercase + string.digits, k=n))
-
-
-def _rand_hash(n: int = 7) -> str:
-    return "".join(random.choices("abcdef" + string.digits, k=n))
+def _choose(seq: List[str]) -> str:
+    return random.choice(seq)
 
 
-def _rand_ts(start_utc: datetime, span_minutes: int = 60 * 24 * 10) -> datetime:
-    """Random timestamp within span_minutes after start_utc."""
-    return start_utc + timedelta(minutes=random.randint(0, span_minutes))
+def _rand_strings(rng: random.Random, alphabet: str, width: int, n: int) -> List[str]:
+    chars = "".join(rng.choices(alphabet, k=width * n))
+    return [chars[i : i + width] for i in range(0, width * n, width)]
+
+
+def _draw_batch_py(rng: random.Random, start_utc: datetime, n: int) -> Tuple[List[Any], ...]:
+    """Draws n good events column by column with bulk random.choices calls."""
+    ts_by_minute: Dict[int, str] = {}
+    decision_ts = []
+    for m in rng.choices(range(SPAN_MINUTES + 1), k=n):
+        ts = ts_by_minute.get(m)
+        if ts is None:
+            ts = ts_by_minute[m] = (start_utc + timedelta(minutes=m)).isoformat().replace("+00:00", "Z")
+        decision_ts.append(ts)
+
+    return (
+        _rand_strings(rng, ID_ALPHABET, 8, n),
+        rng.choices(VALID_DECISION_TYPES, k=n),
+        rng.choices(MODEL_VERSIONS, k=n),
+        [round(rng.uniform(0.35, 0.99), 2) for _ in range(n)],
+        rng.choices(VALID_RISK_BANDS, k=n),
+        rng.choices(POLICY_IDS, k=n),
+        rng.choices(FACILITY_CODES, k=n),
+        decision_ts,
+        _rand_strings(rng, HASH_ALPHABET, 7, n),
+        [rng.random() < OVERRIDE_RATE for _ in range(n)],  # ~18% overrides
+        rng.choices(VALID_OVERRIDE_REASONS, k=n),
+    )
 
 
-def _choose(seq: List[str]) -> str:
-    return random.choice(seq)
+def _np_choice(rng: "np.random.Generator", seq: List[str], n: int) -> List[str]:
+    return np.asarray(seq)[rng.integers(0, len(seq), n)].tolist()
 
 
-def _make_good_event(now_utc: datetime) -> Dict[str, Any]:
-    decision_id = _rand_id("dec")
-    decision_type = _choose(VALID_DECISION_TYPES)
-    model_version = _choose(["risk-model-v1.2", "risk-model-v1.3", "risk-model-v1.4"])
-    confidence_score = round(random.uniform(0.35, 0.99), 2)
-    risk_band = _choose(VALID_RISK_BANDS)
+def _np_strings(rng: "np.random.Generator", alphabet: str, width: int, n: int) -> List[str]:
+    chars = np.asarray(list(alphabet))[rng.integers(0, len(alphabet), (n, width))]
+    # (n, width) array of 1-char strings viewed as n strings of `width` chars
+    return chars.view(f"<U{width}").ravel().tolist()
 
-    policy_id = _choose(["POL-1001", "POL-1002", "POL-1003", "POL-1004", "POL-2001"])
-    facility_code = _choose(["FAC-001", "FAC-023", "FAC-102", "FAC-210"])
 
-    decision_ts = _rand_ts(now_utc - timedelta(days=10)).replace(tzinfo=timezone.utc)
-    override_flag = random.random() < 0.18  # ~18% overrides
+def _draw_batch_np(rng: "np.random.Generator", start_utc: datetime, n: int) -> Tuple[List[Any], ...]:
+    """Same columns as _draw_batch_py, each drawn with a single NumPy call."""
+    start = start_utc.replace(tzinfo=None)
+    ts_unit = "us" if start.microsecond else "s"  # matches datetime.isoformat()
+    minutes = rng.integers(0, SPAN_MINUTES + 1, n).astype("timedelta64[m]")
+    decision_ts = np.datetime_as_string(np.datetime64(start, "us") + minutes, unit=ts_unit)
 
-    event: Dict[str, Any] = {
-        "decision_id": decision_id,
-        "decision_type": decision_type,
-        "model_version": model_version,
-        "confidence_score": confidence_score,
-        "risk_band": risk_band,
-        "policy_id": policy_id,
-        "facility_code": facility_code,
-        "decision_ts": decision_ts.isoformat().replace("+00:00", "Z"),
-        "input_features_hash": _rand_hash(),
-        "override_flag": override_flag,
-    }
+    return (
+        _np_strings(rng, ID_ALPHABET, 8, n),
+        _np_choice(rng, VALID_DECISION_TYPES, n),
+        _np_choice(rng, MODEL_VERSIONS, n),
+        np.round(rng.uniform(0.35, 0.99, n), 2).tolist(),
+        _np_choice(rng, VALID_RISK_BANDS, n),
+        _np_choice(rng, POLICY_IDS, n),
+        _np_choice(rng, FACILITY_CODES, n),
+        np.char.add(decision_ts, "Z").tolist(),
+        _np_strings(rng, HASH_ALPHABET, 7, n),
+        (rng.random(n) < OVERRIDE_RATE).tolist(),
+        _np_choice(rng, VALID_OVERRIDE_REASONS, n),
+    )
 
-    if override_flag:
-        event["override_reason_code"] = _choose(VALID_OVERRIDE_REASONS)
 
-    return event
+def _make_good_events(now_utc: datetime, n: int, seed: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """
+    Yields n valid events. Fields are drawn a batch at a time (NumPy when
+    installed, else a local random.Random); dicts are only built as yielded.
+    """
+    if np is not None:
+        rng: Any = np.random.default_rng(seed)
+        draw_batch = _draw_batch_np
+    else:
+        # Seeded from the global generator rather than with `seed` itself: main() seeds
+        # that one with the same value for the bad-rate/corruption draws, and two
+        # identical streams would tie which events get corrupted to their field draws.
+        rng = random.Random(random.getrandbits(64))
+        draw_batch = _draw_batch_py
+
+    start_utc = now_utc - timedelta(days=10)
+
+    for off in range(0, n, _GEN_BATCH):
+        columns = draw_batch(rng, start_utc, min(_GEN_BATCH, n - off))
+        for (
+            decision_id,
+            decision_type,
+            model_version,
+            confidence_score,
+            risk_band,
+            policy_id,
+            facility_code,
+            decision_ts,
+            input_features_hash,
+            override_flag,
+            override_reason_code,
+        ) in zip(*columns):
+            event: Dict[str, Any] = {
+                "decision_id": "dec_" + decision_id,
+                "decision_type": decision_type,
+                "model_version": model_version,
+                "confidence_score": confidence_score,
+                "risk_band": risk_band,
+                "policy_id": policy_id,
+                "facility_code": facility_code,
+                "decision_ts": decision_ts,
+                "input_features_hash": input_features_hash,
+                "override_flag": override_flag,
+            }
+
+            if override_flag:
+                event["override_reason_code"] = override_reason_code
+
+            yield event
 
 
 def _corrupt_event(event: Dict[str, Any]) -> Dict[str, Any]:
@@ -137,14 +234,20 @@ def generate(cfg: GenConfig) -> Path:
     ts_tag = datetime.now().strftime("%Y%m%d_%H%M%S")
     outpath = cfg.outdir / f"decision_events_synth_{ts_tag}.jsonl"
 
-    with outpath.open("w", encoding="utf-8") as f:
-        for _ in range(cfg.n):
-            ev = _make_good_event(now_utc)
+    events = _make_good_events(now_utc, cfg.n, cfg.seed)
 
+    buf = bytearray()
+    with outpath.open("wb", buffering=_WRITE_BUFFER) as f:
+        for ev in events:
             if random.random() < cfg.bad_rate:
                 ev = _corrupt_event(ev)
 
-            f.write(json.dumps(ev, ensure_ascii=False) + "\n")
+            buf += _json_dumps(ev)
+            buf += b"\n"
+            if len(buf) >= _WRITE_BUFFER:
+                f.write(buf)
+                buf.clear()
+        f.write(buf)
 
     return outpath
 
@@ -25,19 +25,75 @@ Rejects are written with:
 - reject_reason_detail
 - decision_id (if available)
 - raw_payload
+- facility_code (UNKNOWN if missing/blank; absent for INVALID_JSON)
+
+When msgspec is installed, well-formed events are decoded straight into a
+typed struct; everything else goes through validate_event as before.
 """
 
 from __future__ import annotations
 
 import argparse
+import collections
+import contextlib
+import functools
+import io
 import json
-from datetime import datetime, timezone
+import mmap
+import multiprocessing
+import os
+import re
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Annotated, Any, BinaryIO, Callable, Deque, Dict, Iterable, List, Literal, Optional, Tuple
+
+
+def _std_json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+except ImportError:  # stdlib fallback keeps the script dependency-free
+    orjson = None
+    _json_dumps = _std_json_dumps
+
+try:
+    import msgspec
+except ImportError:  # every line goes through validate_event instead
+    msgspec = None
 
 
 VALID_RISK_BANDS = {"LOW", "MEDIUM", "HIGH"}
 
+# reject_reason_code -> reject_reason_detail
+_REJECT_DETAILS = {
+    "INVALID_JSON": "Line is not valid JSON object",
+    "MISSING_DECISION_ID": "decision_id is required",
+    "MISSING_DECISION_TYPE": "decision_type is required",
+    "MISSING_MODEL_VERSION": "model_version is required and must be non-empty",
+    "MISSING_CONFIDENCE_SCORE": "confidence_score is required and must be numeric",
+    "INVALID_CONFIDENCE_SCORE": "confidence_score must be between 0 and 1",
+    "INVALID_RISK_BAND": f"risk_band must be one of {sorted(VALID_RISK_BANDS)}",
+    "MISSING_POLICY_ID": "policy_id is required",
+    "INVALID_DECISION_TS": "decision_ts must be ISO parseable",
+}
+
+# orjson reads integers outside the 64-bit range as floats (and cannot write them back),
+# and rejects the NaN/Infinity tokens json.loads accepts. Lines that may hold
+# either go through stdlib json both ways so their values reach Silver unchanged.
+_WIDE_INT_RE = re.compile(rb"[0-9]{19}")
+
+# Landing files at least this large are split into line-aligned byte ranges across workers.
+_SHARD_MIN_BYTES = 50 * 1024 * 1024
+# Upper bound on the range one task covers, with or without workers: it caps both the
+# mapped landing pages a task touches and the output a pool task holds until returned.
+_SHARD_MAX_BYTES = 16 * 1024 * 1024
+# Output file buffer size and flush threshold for the Silver/Rejects writers.
+_WRITE_BUFFER = 1 << 20
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -47,33 +103,59 @@ def _safe_str(v: Any) -> str:
     return "" if v is None else str(v)
 
 
-def _parse_iso_ts(s: Any) -> Optional[str]:
-    """
-    Accepts ISO strings and returns a normalized Z ISO string.
-    Returns None if invalid.
-    """
-    if s is None:
-        return None
-    if not isinstance(s, str) or not s.strip():
-        return None
+# Already-normalized form emitted by upstream producers: YYYY-MM-DDTHH:MM:SS[.ffffff]Z
+_ISO_Z_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T(?:[01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](?:\.[0-9]{6})?Z")
 
-    raw = s.strip()
 
+@functools.lru_cache(maxsize=4096)
+def _is_valid_date(ymd: str) -> bool:
+    try:
+        date.fromisoformat(ymd)
+        return True
+    except ValueError:
+        return False
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_iso_ts(raw: str) -> Optional[str]:
     try:
         # Handle Z
         if raw.endswith("Z"):
-            dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+            dt = datetime.fromisoformat(raw[:-1] + "+00:00")
         else:
             dt = datetime.fromisoformat(raw)
 
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
+        elif dt.tzinfo != timezone.utc:
+            dt = dt.astimezone(timezone.utc)
 
-        return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+        # isoformat() of a UTC datetime always ends in "+00:00"
+        return dt.isoformat()[:-6] + "Z"
     except Exception:
         return None
 
 
+def _parse_iso_ts(s: Any) -> Optional[str]:
+    """
+    Accepts ISO strings and returns a normalized Z ISO string.
+    Returns None if invalid.
+    """
+    if s is None:
+        return None
+    if not isinstance(s, str) or not s.strip():
+        return None
+
+    raw = s.strip()
+
+    # Fast path: input is already in normalized form, so it is its own result.
+    # (isoformat() drops an all-zero fraction, so leave that case to the slow path.)
+    if _ISO_Z_RE.fullmatch(raw) and _is_valid_date(raw[:10]) and not raw.endswith(".000000Z"):
+        return raw
+
+    return _normalize_iso_ts(raw)
+
+
 def _as_float(v: Any) -> Optional[float]:
     if v is None:
         return None
@@ -84,19 +166,176 @@ def _as_float(v: Any) -> Optional[float]:
         return None
 
 
+def _loads_line(line: bytes) -> Tuple[Any, Callable[[Any], bytes]]:
+    """Parses one JSONL line; returns the object and the serializer that round-trips it exactly."""
+    if orjson is not None and _WIDE_INT_RE.search(line) is None:
+        try:
+            return orjson.loads(line), orjson.dumps
+        except orjson.JSONDecodeError:
+            pass  # may still be NaN/Infinity, which json.loads accepts
+    return json.loads(line), _std_json_dumps
+
+
 def _iter_jsonl_files(indir: Path) -> Iterable[Path]:
     if not indir.exists():
         return []
     return sorted(indir.glob("*.jsonl"))
 
 
-def validate_event(raw: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+def _iter_jsonl_bytes(path: Path, start: int = 0, end: Optional[int] = None) -> Iterable[bytes]:
+    """
+    Yields the stripped, non-empty lines of a JSONL file as bytes, read from a
+    memory map. With start/end, only lines beginning inside [start, end) are read.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            mm.seek(start)
+            pos = start
+            for line in iter(mm.readline, b""):
+                if end is not None and pos >= end:
+                    break
+                pos += len(line)
+                line = line.strip()
+                if line:
+                    yield line
+
+
+def _line_aligned_ranges(path: Path, n: int) -> List[Tuple[int, int]]:
+    """Splits a file into up to n byte ranges, each starting at the beginning of a line."""
+    size = path.stat().st_size
+    bounds = [0]
+    with path.open("rb") as f:
+        for i in range(1, n):
+            f.seek(max(size * i // n - 1, bounds[-1]))
+            f.readline()  # finish the line straddling the cut
+            pos = f.tell()
+            if pos >= size:
+                break
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+if msgspec is not None:
+
+    class _CanonicalEvent(msgspec.Struct):
+        """
+        Strict shape of a well-formed event: string ids, a numeric score in
+        [0..1] and an upper-case risk band. Anything looser (numeric strings,
+        lower-case bands, non-string ids, ...) fails to decode and is handled
+        by validate_event, which also decides the reject reason.
+        """
+
+        decision_id: str
+        decision_type: str
+        model_version: str
+        confidence_score: Annotated[float, msgspec.Meta(ge=0.0, le=1.0)]
+        risk_band: Literal["LOW", "MEDIUM", "HIGH"]
+        policy_id: str
+        decision_ts: str
+        facility_code: Any = None
+        input_features_hash: Any = None
+        override_flag: Any = None
+        override_reason_code: Any = None
+
+    _CANONICAL_DECODER = msgspec.json.Decoder(_CanonicalEvent)
+else:
+    _CANONICAL_DECODER = None
+
+
+def _decode_canonical(line: bytes, rejected_at: str) -> Optional[Dict[str, Any]]:
+    """
+    Returns the clean record if line decodes as a well-formed event, else None
+    (the caller then falls back to json parsing + validate_event).
+    """
+    try:
+        ev = _CANONICAL_DECODER.decode(line)
+    except (msgspec.MsgspecError, UnicodeDecodeError):
+        return None  # e.g. invalid UTF-8: rejected as INVALID_JSON below, as without msgspec
+
+    decision_id = ev.decision_id.strip()
+    decision_type = ev.decision_type.strip()
+    model_version = ev.model_version.strip()
+    policy_id = ev.policy_id.strip()
+    decision_ts = _parse_iso_ts(ev.decision_ts)
+    if not (decision_id and decision_type and model_version and policy_id) or decision_ts is None:
+        return None
+
+    return _clean_record(
+        decision_id,
+        decision_type,
+        model_version,
+        ev.confidence_score,
+        ev.risk_band,
+        policy_id,
+        _safe_str(ev.facility_code).strip() or "UNKNOWN",
+        decision_ts,
+        ev.input_features_hash,
+        ev.override_flag,
+        ev.override_reason_code,
+        rejected_at,
+    )
+
+
+def _mkrej(rejected_at: str, decision_id: Optional[str], code: str, facility_code: Optional[str] = None) -> Dict[str, Any]:
+    # raw_payload is a placeholder (keeps key order); the caller sets it to the original line.
+    reject: Dict[str, Any] = {
+        "rejected_at_utc": rejected_at,
+        "decision_id": decision_id,
+        "reject_reason_code": code,
+        "reject_reason_detail": _REJECT_DETAILS[code],
+        "raw_payload": None,
+    }
+    if facility_code is not None:
+        reject["facility_code"] = facility_code
+    return reject
+
+
+def _clean_record(
+    decision_id: str,
+    decision_type: str,
+    model_version: str,
+    conf: float,
+    risk_band: str,
+    policy_id: str,
+    facility_code: str,
+    decision_ts: str,
+    input_features_hash: Any,
+    override_flag: Any,
+    override_reason_code: Any,
+    rejected_at: str,
+) -> Dict[str, Any]:
+    """
+    Builds the Silver clean record from already validated and normalized fields.
+    Shared by validate_event and the msgspec fast path so both write the same contract.
+    """
+    return {
+        "decision_id": decision_id,
+        "decision_type": decision_type,
+        "model_version": model_version,
+        "confidence_score": round(conf, 4),
+        "risk_band": risk_band,
+        "policy_id": policy_id,
+        "facility_code": facility_code,
+        "decision_ts": decision_ts,
+        "input_features_hash": input_features_hash,
+        "override_flag": bool(override_flag) if override_flag is not None else None,
+        "override_reason_code": override_reason_code,
+        "ingested_at_utc": rejected_at,  # lineage marker for silver
+    }
+
+
+def validate_event(raw: Dict[str, Any], rejected_at: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
     """
     Returns (clean_record, reject_record).
     Exactly one will be non-None.
+    rejected_at is the batch timestamp, used for rejected_at_utc / ingested_at_utc.
+    Reject records carry facility_code (UNKNOWN if missing); the caller fills
+    in raw_payload with the original line.
     """
-    rejected_at = _utc_now_iso()
-    raw_payload = json.dumps(raw, ensure_ascii=False)
 
     decision_id = _safe_str(raw.get("decision_id")).strip() or None
     decision_type = _safe_str(raw.get("decision_type")).strip() or None
@@ -116,101 +355,145 @@ def validate_event(raw: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optio
 
     # Reject conditions
     if not decision_id:
-        return None, {
-            "rejected_at_utc": rejected_at,
-            "decision_id": None,
-            "reject_reason_code": "MISSING_DECISION_ID",
-            "reject_reason_detail": "decision_id is required",
-            "raw_payload": raw_payload,
-        }
+        return None, _mkrej(rejected_at, None, "MISSING_DECISION_ID", facility_code)
 
     if not decision_type:
-        return None, {
-            "rejected_at_utc": rejected_at,
-            "decision_id": decision_id,
-            "reject_reason_code": "MISSING_DECISION_TYPE",
-            "reject_reason_detail": "decision_type is required",
-            "raw_payload": raw_payload,
-        }
+        return None, _mkrej(rejected_at, decision_id, "MISSING_DECISION_TYPE", facility_code)
 
     if model_version is None or (isinstance(model_version, str) and not model_version.strip()):
-        return None, {
-            "rejected_at_utc": rejected_at,
-            "decision_id": decision_id,
-            "reject_reason_code": "MISSING_MODEL_VERSION",
-            "reject_reason_detail": "model_version is required and must be non-empty",
-            "raw_payload": raw_payload,
-        }
+        return None, _mkrej(rejected_at, decision_id, "MISSING_MODEL_VERSION", facility_code)
 
     if conf is None:
-        return None, {
-            "rejected_at_utc": rejected_at,
-            "decision_id": decision_id,
-            "reject_reason_code": "MISSING_CONFIDENCE_SCORE",
-            "reject_reason_detail": "confidence_score is required and must be numeric",
-            "raw_payload": raw_payload,
-        }
+        return None, _mkrej(rejected_at, decision_id, "MISSING_CONFIDENCE_SCORE", facility_code)
 
     if conf < 0.0 or conf > 1.0:
-        return None, {
-            "rejected_at_utc": rejected_at,
-            "decision_id": decision_id,
-            "reject_reason_code": "INVALID_CONFIDENCE_SCORE",
-            "reject_reason_detail": "confidence_score must be between 0 and 1",
-            "raw_payload": raw_payload,
-        }
+        return None, _mkrej(rejected_at, decision_id, "INVALID_CONFIDENCE_SCORE", facility_code)
 
     if risk_band not in VALID_RISK_BANDS:
-        return None, {
-            "rejected_at_utc": rejected_at,
-            "decision_id": decision_id,
-            "reject_reason_code": "INVALID_RISK_BAND",
-            "reject_reason_detail": f"risk_band must be one of {sorted(VALID_RISK_BANDS)}",
-            "raw_payload": raw_payload,
-        }
+        return None, _mkrej(rejected_at, decision_id, "INVALID_RISK_BAND", facility_code)
 
     if not policy_id:
-        return None, {
-            "rejected_at_utc": rejected_at,
-            "decision_id": decision_id,
-            "reject_reason_code": "MISSING_POLICY_ID",
-            "reject_reason_detail": "policy_id is required",
-            "raw_payload": raw_payload,
-        }
+        return None, _mkrej(rejected_at, decision_id, "MISSING_POLICY_ID", facility_code)
 
     if decision_ts is None:
-        return None, {
-            "rejected_at_utc": rejected_at,
-            "decision_id": decision_id,
-            "reject_reason_code": "INVALID_DECISION_TS",
-            "reject_reason_detail": "decision_ts must be ISO parseable",
-            "raw_payload": raw_payload,
-        }
+        return None, _mkrej(rejected_at, decision_id, "INVALID_DECISION_TS", facility_code)
 
     # Clean record
-    clean: Dict[str, Any] = {
-        "decision_id": decision_id,
-        "decision_type": decision_type,
-        "model_version": _safe_str(model_version).strip(),
-        "confidence_score": round(conf, 4),
-        "risk_band": risk_band,
-        "policy_id": policy_id,
-        "facility_code": facility_code,
-        "decision_ts": decision_ts,
-        "input_features_hash": raw.get("input_features_hash"),
-        "override_flag": bool(raw.get("override_flag")) if raw.get("override_flag") is not None else None,
-        "override_reason_code": raw.get("override_reason_code"),
-        "ingested_at_utc": rejected_at,  # lineage marker for silver
-    }
+    clean = _clean_record(
+        decision_id,
+        decision_type,
+        _safe_str(model_version).strip(),
+        conf,
+        risk_band,
+        policy_id,
+        facility_code,
+        decision_ts,
+        raw.get("input_features_hash"),
+        raw.get("override_flag"),
+        raw.get("override_reason_code"),
+        rejected_at,
+    )
 
     return clean, None
 
 
+def _validate_shard(
+    shard: Tuple[Path, int, Optional[int]], rejected_at: str, s_f: BinaryIO, r_f: BinaryIO
+) -> Tuple[int, int]:
+    """
+    Validate one (path, start, end) byte range of a landing file (end=None for
+    the whole file), stamping records with the batch time rejected_at.
+    Clean and reject records are written to s_f / r_f as newline-terminated
+    JSONL, in chunks of about _WRITE_BUFFER bytes. Returns (clean_count, reject_count).
+    """
+    clean_buf = bytearray()
+    reject_buf = bytearray()
+    clean_count = 0
+    reject_count = 0
+
+    path, start, end = shard
+    for line in _iter_jsonl_bytes(path, start, end):
+        # Flush before handling the line, so branches that `continue` are covered too.
+        if len(clean_buf) >= _WRITE_BUFFER:
+            s_f.write(clean_buf)
+            clean_buf.clear()
+        if len(reject_buf) >= _WRITE_BUFFER:
+            r_f.write(reject_buf)
+            reject_buf.clear()
+
+        if _CANONICAL_DECODER is not None:
+            clean = _decode_canonical(line, rejected_at)
+            if clean is not None:
+                try:
+                    clean_buf += _json_dumps(clean)
+                except TypeError:
+                    pass  # orjson can't write ints wider than 64 bits; the stdlib path below can
+                else:
+                    clean_buf += b"\n"
+                    clean_count += 1
+                    continue
+
+        try:
+            raw, dumps = _loads_line(line)
+            if not isinstance(raw, dict):
+                raise ValueError("JSONL line is not an object")
+        except Exception:
+            reject = _mkrej(rejected_at, None, "INVALID_JSON")
+            reject["raw_payload"] = line.decode("utf-8", errors="replace")
+            reject_buf += _json_dumps(reject)
+            reject_buf += b"\n"
+            reject_count += 1
+            continue
+
+        clean, reject = validate_event(raw, rejected_at)
+        if clean is not None:
+            if clean["confidence_score"] != clean["confidence_score"]:
+                dumps = _std_json_dumps  # NaN score (e.g. "nan"); orjson would write null
+            clean_buf += dumps(clean)
+            clean_buf += b"\n"
+            clean_count += 1
+        else:
+            reject["raw_payload"] = line.decode("utf-8", errors="replace")
+            reject_buf += dumps(reject)
+            reject_buf += b"\n"
+            reject_count += 1
+
+    s_f.write(clean_buf)
+    r_f.write(reject_buf)
+    return clean_count, reject_count
+
+
+def _process_shard(shard: Tuple[Path, int, Optional[int]], rejected_at: str) -> Tuple[bytes, bytes, int, int]:
+    """
+    Pool task: _validate_shard into memory, returning
+    (clean_bytes, reject_bytes, clean_count, reject_count).
+    """
+    s_f = io.BytesIO()
+    r_f = io.BytesIO()
+    clean_count, reject_count = _validate_shard(shard, rejected_at, s_f, r_f)
+    return s_f.getvalue(), r_f.getvalue(), clean_count, reject_count
+
+
+def _imap_bounded(pool: Any, fn: Callable[[Any], Any], items: Iterable[Any], window: int) -> Iterable[Any]:
+    """
+    Like pool.imap (results in input order), but with at most `window` tasks
+    submitted and not yet consumed, so finished results can't pile up in memory.
+    """
+    pending: Deque[Any] = collections.deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().get()
+        pending.append(pool.apply_async(fn, (item,)))
+    while pending:
+        yield pending.popleft().get()
+
+
 def main() -> None:
     p = argparse.ArgumentParser()
     p.add_argument("--indir", default="data/landing/decision_events", help="Input directory containing JSONL.")
     p.add_argument("--silver-out", default="data/silver/decision_events_clean.jsonl", help="Silver output JSONL.")
     p.add_argument("--rejects-out", default="data/rejects/decision_events_rejects.jsonl", help="Rejects output JSONL.")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (one landing file, or a range of a large one, per task).")
     args = p.parse_args()
 
     indir = Path(args.indir)
@@ -224,45 +507,42 @@ def main() -> None:
     if not files:
         raise SystemExit(f"No JSONL files found in {indir.resolve()}")
 
+    shards: List[Tuple[Path, int, Optional[int]]] = []
+    for fp in files:
+        size = fp.stat().st_size
+        n = -(-size // _SHARD_MAX_BYTES)
+        if args.workers > 1 and size >= _SHARD_MIN_BYTES:
+            n = max(n, args.workers)
+        if n > 1:
+            shards.extend((fp, start, end) for start, end in _line_aligned_ranges(fp, n))
+        else:
+            shards.append((fp, 0, None))
+
+    workers = max(1, min(args.workers, len(shards)))
+    # One lineage timestamp for the whole run rather than a clock read per event.
+    rejected_at = _utc_now_iso()
+
     clean_count = 0
     reject_count = 0
 
-    with silver_out.open("w", encoding="utf-8") as s_f, rejects_out.open("w", encoding="utf-8") as r_f:
-        for fp in files:
-            with fp.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        raw = json.loads(line)
-                        if not isinstance(raw, dict):
-                            raise ValueError("JSONL line is not an object")
-                    except Exception:
-                        reject = {
-                            "rejected_at_utc": _utc_now_iso(),
-                            "decision_id": None,
-                            "reject_reason_code": "INVALID_JSON",
-                            "reject_reason_detail": "Line is not valid JSON object",
-                            "raw_payload": line,
-                        }
-                        r_f.write(json.dumps(reject, ensure_ascii=False) + "\n")
-                        reject_count += 1
-                        continue
-
-                    clean, reject = validate_event(raw)
-                    if clean is not None:
-                        s_f.write(json.dumps(clean, ensure_ascii=False) + "\n")
-                        clean_count += 1
-                    else:
-                        # Ensure reject_reason_code uppercase normalized
-                        reject["reject_reason_code"] = _safe_str(reject.get("reject_reason_code")).upper()
-                        # Ensure facility_code present in rejects? (optional but useful)
-                        # We can include facility_code if it existed in payload; else UNKNOWN
-                        fc = _safe_str(raw.get("facility_code")).strip() or "UNKNOWN"
-                        reject["facility_code"] = fc
-                        r_f.write(json.dumps(reject, ensure_ascii=False) + "\n")
-                        reject_count += 1
+    with contextlib.ExitStack() as stack:
+        s_f = stack.enter_context(silver_out.open("wb", buffering=_WRITE_BUFFER))
+        r_f = stack.enter_context(rejects_out.open("wb", buffering=_WRITE_BUFFER))
+
+        if workers > 1:
+            pool = stack.enter_context(multiprocessing.Pool(workers))
+            process_shard = functools.partial(_process_shard, rejected_at=rejected_at)
+            # Ordered results keep Silver/Rejects in landing file order.
+            for clean_buf, reject_buf, c, r in _imap_bounded(pool, process_shard, shards, workers):
+                s_f.write(clean_buf)
+                r_f.write(reject_buf)
+                clean_count += c
+                reject_count += r
+        else:
+            for shard in shards:
+                c, r = _validate_shard(shard, rejected_at, s_f, r_f)
+                clean_count += c
+                reject_count += r
 
     print(f"Validated landing events from {len(files)} file(s)")
     print(f"Silver clean written to: {silver_out} (rows={clean_count})")
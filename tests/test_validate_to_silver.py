@@ -0,0 +1,125 @@
+"""
+Parity checks for validate_to_silver's msgspec fast path.
+
+_decode_canonical must accept only events validate_event would also clean
+and produce the identical record for them; anything else must fall back.
+
+Run with:  python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import validate_to_silver as v  # noqa: E402
+
+REJECTED_AT = "2026-01-01T00:00:00Z"
+
+# First value of each list is the canonical one; the rest are edge cases.
+FIELD_VALUES = {
+    "decision_id": ["d1", " d1", "d1\n", "", None, 5, "a b"],
+    "decision_type": ["t", " t", None, ""],
+    "model_version": ["m", "m ", "", None, 3, True],
+    "confidence_score": [0.5, 1, 0, 1.0, -0.1, 1.2, "0.5", True, None, 0.123456, 1e-7, "nan", 10**30],
+    "risk_band": ["LOW", "MEDIUM", "low", " HIGH", "MID", None],
+    "policy_id": ["p", "", " p", None],
+    "decision_ts": [
+        "2026-01-01T05:00:00Z",
+        "2026-01-01T05:00:00+02:00",
+        "2026-01-01T05:00:00.000000Z",
+        "2026-02-30T00:00:00Z",
+        "bad",
+        None,
+    ],
+    "facility_code": ["F", " F ", "", None, 7],
+    "input_features_hash": ["h", None, 2**64, -(2**63) - 1, 123456789012345678901234567890, [1, {"a": 2**70}]],
+    "override_flag": [True, False, None, 0, "yes"],
+    "override_reason_code": ["r", None, 2**64],
+}
+
+
+def _random_events(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield {
+            k: (opts[0] if rng.random() < 0.75 else rng.choice(opts))
+            for k, opts in FIELD_VALUES.items()
+            if rng.random() < 0.95
+        }
+
+
+def _run_shard(lines):
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "landing.jsonl"
+        path.write_bytes(b"".join(line + b"\n" for line in lines))
+        s_f, r_f = io.BytesIO(), io.BytesIO()
+        counts = v._validate_shard((path, 0, None), REJECTED_AT, s_f, r_f)
+    clean = [json.loads(line) for line in s_f.getvalue().splitlines()]
+    rejects = [json.loads(line) for line in r_f.getvalue().splitlines()]
+    return counts, clean, rejects
+
+
+@unittest.skipIf(v.msgspec is None, "msgspec not installed")
+class FastPathParityTest(unittest.TestCase):
+    def test_fast_path_matches_validate_event(self):
+        hits = 0
+        for event in _random_events(20_000):
+            line = json.dumps(event).encode("utf-8")
+            fast = v._decode_canonical(line, REJECTED_AT)
+            if fast is None:
+                continue
+            hits += 1
+            slow, reject = v.validate_event(json.loads(line), REJECTED_AT)
+            self.assertIsNone(reject, event)
+            self.assertEqual(list(fast.items()), list(slow.items()), event)
+        self.assertGreater(hits, 0)  # the fast path must actually be exercised
+
+    def test_canonical_event_takes_fast_path(self):
+        event = {k: opts[0] for k, opts in FIELD_VALUES.items()}
+        self.assertIsNotNone(v._decode_canonical(json.dumps(event).encode("utf-8"), REJECTED_AT))
+
+    def test_invalid_utf8_falls_back(self):
+        line = b'{"decision_id":"a\xff","decision_type":"t"}'
+        self.assertIsNone(v._decode_canonical(line, REJECTED_AT))
+
+
+class ValidateShardTest(unittest.TestCase):
+    def test_shard_output_matches_validate_event(self):
+        events = list(_random_events(5_000, seed=1))
+        counts, clean, rejects = _run_shard([json.dumps(e).encode("utf-8") for e in events])
+
+        expected_clean, expected_reject_codes = [], []
+        for event in events:
+            c, r = v.validate_event(event, REJECTED_AT)
+            if c is not None:
+                expected_clean.append(c)
+            else:
+                expected_reject_codes.append(r["reject_reason_code"])
+
+        self.assertEqual(counts, (len(expected_clean), len(expected_reject_codes)))
+        self.assertEqual(json.dumps(clean), json.dumps(expected_clean))
+        self.assertEqual([r["reject_reason_code"] for r in rejects], expected_reject_codes)
+
+    def test_wide_ints_and_invalid_utf8(self):
+        good = {k: opts[0] for k, opts in FIELD_VALUES.items()}
+        wide = dict(good, input_features_hash=123456789012345678901234567890, override_reason_code=2**64)
+        lines = [json.dumps(wide).encode("utf-8"), json.dumps(good).encode("utf-8").replace(b'"d1"', b'"d\xff"')]
+
+        counts, clean, rejects = _run_shard(lines)
+
+        self.assertEqual(counts, (1, 1))
+        self.assertEqual(clean[0]["input_features_hash"], 123456789012345678901234567890)
+        self.assertEqual(clean[0]["override_reason_code"], 2**64)
+        self.assertEqual(rejects[0]["reject_reason_code"], "INVALID_JSON")
+
+
+if __name__ == "__main__":
+    unittest.main()